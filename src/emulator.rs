@@ -4,7 +4,7 @@ extern crate clap;
 mod models;
 mod util;
 mod workers;
-use models::{Message, ReadType};
+use models::{ChipRead, Message, ReadType};
 use workers::{ClientConnector, ClientPool};
 
 use crate::util::{is_delay, is_file, is_port, signal_handler};
@@ -33,7 +33,7 @@ fn generate_read(read_type: ReadType) -> String {
         now.second(),
         now.nanosecond() / 10000000
     );
-    let checksum = read[2..34].bytes().map(|b| b as u32).sum::<u32>() as u8;
+    let checksum = ChipRead::checksum(&read);
     match read_type {
         ReadType::RAW => format!("{}{:02x}", read, checksum),
         ReadType::FSLS => format!("{}{:02x}LS", read, checksum)
@@ -54,6 +54,12 @@ impl ChipRead {
     pub fn time_string(&self) -> String {
         self.timestamp.time_string()
     }
+
+    /// Calculate the checksum of a read, which is the sum of characters 2-33
+    /// truncated to a byte.
+    pub fn checksum(read: &str) -> u8 {
+        read[2..34].bytes().fold(0u8, |sum, b| sum.wrapping_add(b))
+    }
 }
 
 impl TryFrom<&str> for ChipRead {
@@ -64,8 +70,7 @@ impl TryFrom<&str> for ChipRead {
         if !(chip_read.len() == 36 || chip_read.len() == 38) {
             return Err("Invalid read length");
         }
-        let checksum = chip_read[2..34].bytes().map(|b| b as u32).sum::<u32>() as u8;
-        if format!("{:02x}", checksum) != chip_read[34..36] {
+        if format!("{:02x}", ChipRead::checksum(chip_read)) != chip_read[34..36] {
             return Err("Checksum doesn't match");
         }
         let mut read_type = ReadType::RAW;
@@ -152,6 +157,18 @@ mod tests {
         );
     }
 
+    #[test]
+    fn checksum() {
+        assert_eq!(
+            ChipRead::checksum("aa400000000123450a2a01123018455927a7"),
+            0xa7
+        );
+        assert_eq!(
+            ChipRead::checksum("aaffffffffffffffffffffffffffffffff"),
+            0xc0
+        );
+    }
+
     #[test]
     fn invalid_checksum() {
         let read = ChipRead::try_from("aa400000000123450a2a01123018455927a8");
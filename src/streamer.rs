@@ -120,7 +120,7 @@ async fn main() {
     let args = get_args();
 
     // Create in memory DB for storing participant data
-    let conn = Connection::open_in_memory().unwrap();
+    let mut conn = Connection::open_in_memory().unwrap();
     conn.execute(
         "CREATE TABLE participant (
                   bib           INTEGER PRIMARY KEY,
@@ -143,39 +143,45 @@ async fn main() {
     )
     .unwrap();
 
+    // Load everything in a single transaction, rather than one per insert
+    let tx = conn.transaction().unwrap();
     // Get bib chips
     if args.bib_chip_file_path.is_some() {
         let bib_chips = read_bibchip_file(&args.bib_chip_file_path.unwrap().as_str())
             .unwrap_or_else(|_| vec![]);
-        for c in &bib_chips {
-            conn.execute(
+        let mut stmt = tx
+            .prepare(
                 "INSERT INTO chip (id, bib)
                         VALUES (?1, ?2)",
-                &[&c.id as &dyn ToSql, &c.bib],
             )
             .unwrap();
+        for c in &bib_chips {
+            stmt.execute(&[&c.id as &dyn ToSql, &c.bib]).unwrap();
         }
     }
     // Get participants
     if args.participants_file_path.is_some() {
         let participants = read_participant_file(&args.participants_file_path.unwrap().as_str())
             .unwrap_or_else(|_| vec![]);
-        for p in &participants {
-            conn.execute(
+        let mut stmt = tx
+            .prepare(
                 "INSERT INTO participant (bib, first_name, last_name, gender, affiliation, division)
                         VALUES (?1, ?2, ?3, ?4, ?5, ?6)",
-                &[
-                    &p.bib as &dyn ToSql,
-                    &p.first_name as &dyn ToSql,
-                    &p.last_name as &dyn ToSql,
-                    &format!("{}", p.gender),
-                    &p.affiliation as &dyn ToSql,
-                    &p.division as &dyn ToSql,
-                ],
             )
             .unwrap();
+        for p in &participants {
+            stmt.execute(&[
+                &p.bib as &dyn ToSql,
+                &p.first_name as &dyn ToSql,
+                &p.last_name as &dyn ToSql,
+                &format!("{}", p.gender),
+                &p.affiliation as &dyn ToSql,
+                &p.division as &dyn ToSql,
+            ])
+            .unwrap();
         }
     }
+    tx.commit().unwrap();
 
     // Bus to send messages to client pool
     let (bus_tx, rx) = mpsc::channel::<Message>(1000);
@@ -18,12 +18,13 @@ pub fn read_file(path_str: &str) -> Result<Vec<String>, String> {
         }
         Ok(buf) => buf,
     };
-    match std::str::from_utf8(&buffer) {
-        Err(_desc) => match WINDOWS_1252.decode(buffer.as_slice(), DecoderTrap::Replace) {
+    // Take ownership of the buffer so valid UTF-8 doesn't need to be copied
+    match String::from_utf8(buffer) {
+        Err(error) => match WINDOWS_1252.decode(error.as_bytes(), DecoderTrap::Replace) {
             Err(desc) => Err(format!("Couldn't read {}: {}", path.display(), desc)),
-            Ok(s) => Ok(s.to_owned()),
+            Ok(s) => Ok(s),
         },
-        Ok(s) => Ok(s.to_owned()),
+        Ok(s) => Ok(s),
     }
     .map(|s| s.split('\n').map(|s| s.to_owned()).collect())
 }
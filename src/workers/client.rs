@@ -19,7 +19,7 @@ impl Client {
     }
 
     /// Send a single read to the connected client.
-    pub async fn send_read(&mut self, read: String) -> Result<usize, SocketAddr> {
+    pub async fn send_read(&mut self, read: &str) -> Result<usize, SocketAddr> {
         self.stream
             .write(read.as_bytes())
             .await
@@ -13,8 +13,9 @@ fn read_to_string(read: &str, conn: &rusqlite::Connection, read_count: &u32) ->
     match ChipRead::try_from(read) {
         Err(desc) => format!("Error reading chip {}", desc),
         Ok(read) => {
+            // Reuse the compiled statement between reads
             let mut stmt = conn
-                .prepare(
+                .prepare_cached(
                     "SELECT
                             c.id,
                             c.bib,
@@ -124,15 +125,17 @@ impl ClientPool {
                     read_count += 1;
                     // Only write to file if a file was supplied
                     if self.file_writer.is_some() {
-                        write!(
-                            self.file_writer.as_mut().unwrap(),
-                            "{}{}",
-                            r.replace(|c: char| !c.is_alphanumeric(), ""),
-                            line_ending
-                        )
-                        .unwrap_or_else(|e| {
-                            println!("\r\x1b[2KError writing read to file: {}", e);
-                        });
+                        // Build the whole line first so it goes out in a
+                        // single write, rather than one per piece.
+                        let mut line = r.replace(|c: char| !c.is_alphanumeric(), "");
+                        line.push_str(line_ending);
+                        self.file_writer
+                            .as_mut()
+                            .unwrap()
+                            .write_all(line.as_bytes())
+                            .unwrap_or_else(|e| {
+                                println!("\r\x1b[2KError writing read to file: {}", e);
+                            });
                     }
                     match &self.db_conn {
                         Some(conn) => {
@@ -148,22 +151,15 @@ impl ClientPool {
                     }
                     let mut futures = Vec::new();
                     for client in self.clients.iter_mut() {
-                        futures.push(client.send_read(r.clone()));
+                        futures.push(client.send_read(&r));
                     }
                     let results = join_all(futures).await;
                     // If a client returned an error, remove it from future
-                    // transmissions.
-                    for r in results.iter() {
-                        if r.is_err() {
-                            let pos = self
-                                .clients
-                                .iter()
-                                .position(|c| c.get_addr() == r.err().unwrap());
-                            if pos.is_some() {
-                                self.clients.remove(pos.unwrap());
-                            }
-                        }
-                    }
+                    // transmissions. The results are in the same order as
+                    // the clients, so this can be done in a single pass.
+                    let mut results = results.iter();
+                    self.clients
+                        .retain(|_| results.next().map_or(true, |r| r.is_ok()));
                 }
                 Message::SHUTDOWN => {
                     for client in self.clients {
@@ -1,8 +1,16 @@
 use crate::models::{ReadType, Message};
+use std::cmp::min;
 use std::net::SocketAddrV4;
+use std::time::Duration;
 use tokio::net::TcpStream;
 use tokio::prelude::*;
 use tokio::sync::mpsc::Sender;
+use tokio::time::delay_for;
+
+/// Delay before the first retry of a failed reader connection.
+const MIN_RETRY_DELAY: Duration = Duration::from_millis(100);
+/// Longest delay between reader connection attempts.
+const MAX_RETRY_DELAY: Duration = Duration::from_secs(5);
 
 /// Receives reads from the reader, then forwards them to the client pool.
 #[derive(Debug)]
@@ -30,6 +38,7 @@ impl TimingReader {
     /// This function should never return.
     pub async fn begin(&mut self) {
         let mut input_buffer = vec![0u8; self.read_type as usize];
+        let mut retry_delay = MIN_RETRY_DELAY;
         loop {
             match self.stream.as_mut() {
                 Some(stream) => {
@@ -64,10 +73,15 @@ impl TimingReader {
                     let stream = match TcpStream::connect(self.addr).await {
                         Ok(stream) => {
                             println!("Connected to reader: {}", self.addr);
+                            retry_delay = MIN_RETRY_DELAY;
                             stream
                         }
                         Err(error) => {
                             println!("Failed to connect to reader: {}", error);
+                            // Back off, doubling the delay each time, so an
+                            // unreachable reader doesn't spin the CPU
+                            delay_for(retry_delay).await;
+                            retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY);
                             continue;
                         }
                     };